@@ -2,6 +2,7 @@ import typer, sys
 from typing import Optional, List
 
 from .config import Config
+from .llms.open_ai import GPT3
 from .repl import REPL
 from .repl.search import fuzzy_search_input
 from .modes import list_modes
@@ -15,6 +16,9 @@ printer.set_syntax_detection(
   not config.get_setting('disableSyntaxDetection', False)
 )
 
+if config.get_setting('cacheCompletions', False):
+  GPT3.enable_cache(config.folders.add('cache'))
+
 # I'd like to have completion but I find the completion flags in --help distracting
 app = typer.Typer(
   add_completion=False,
@@ -1,5 +1,5 @@
 import os, json, re, importlib.util
-from ..utils import printer, expand_path
+from ..utils import printer, expand_path, write_file_atomic
 from ..threads import ThreadManager
 from .folders import Folders
 from .profile import Profile
@@ -38,8 +38,7 @@ class Config:
     self.reload()
 
   def save(self):
-      with open(self.config_file_path, 'w') as config_file:
-        json.dump(self.config or {}, config_file, indent=2)
+    write_file_atomic(self.config_file_path, json.dumps(self.config or {}, indent=2), sync=True)
 
   def reload(self):
     self.config = {}
@@ -68,12 +67,12 @@ class Config:
     with open(file_path, 'r') as file:
       return file.read()
 
+  # Plugins run in file order on the main thread. They register
+  # modes and may use main-thread-only APIs, so they can't safely
+  # be executed concurrently.
   def load_plugins(self):
-    files = self.folders.get_files('plugins')
-    for file in files:
-      file_path = self.folders.get_file_path('plugins', file)
-      if not file_path.endswith('.py'):
-        continue
+    file_paths = sorted(self.folders.get_file_paths('plugins', '.py'))
+    for file_path in file_paths:
       try:
         spec = importlib.util.spec_from_file_location('plugins', file_path)
         module = importlib.util.module_from_spec(spec)
@@ -31,6 +31,20 @@ class Folders:
       return None
     return os.listdir(folder_path)
 
+  # Uses scandir so the file type check comes from the directory
+  # listing instead of a stat per entry
+  def get_file_paths(self, folder_name, extension=''):
+    folder_path = self.get_path(folder_name)
+    if not folder_path:
+      return None
+    with os.scandir(folder_path) as entries:
+      return [
+        entry.path for entry in entries
+        if not entry.name.startswith(('.', '__'))
+          and entry.name.endswith(extension)
+          and entry.is_file()
+      ]
+
   def get_file_path(self, folder_name, file_name, optional_extensions=[]):
     if type(file_name) is list:
       file_name = os.path.join(*file_name)
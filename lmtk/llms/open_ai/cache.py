@@ -0,0 +1,36 @@
+import os, json, hashlib, re, time
+from ...utils import expand_path, write_file_atomic
+
+# Exact-match cache of completions, stored as one JSON file per
+# request. Keys hash every request parameter, so the same prompt
+# with different settings is a miss.
+class CompletionCache:
+
+  replay_delay = 0.01
+
+  def __init__(self, folder_path):
+    self.folder_path = folder_path
+
+  def key(self, *args, **kwargs):
+    data = json.dumps([ args, kwargs ], sort_keys=True)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+  def get(self, key):
+    file_path = self.get_file_path(key)
+    if not os.path.isfile(file_path):
+      return None
+    with open(file_path, 'r') as cache_file:
+      return json.load(cache_file).get('text')
+
+  def set(self, key, text):
+    write_file_atomic(self.get_file_path(key), json.dumps({ 'text': text }))
+
+  # Streams a cached completion back a word at a time so it looks
+  # the same as a live response
+  def replay(self, text):
+    for word in re.findall(r'\s*\S+\s*|\s+', text):
+      yield word
+      time.sleep(self.replay_delay)
+
+  def get_file_path(self, key):
+    return expand_path(self.folder_path, f'{key}.json')
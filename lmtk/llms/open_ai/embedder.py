@@ -1,4 +1,3 @@
-import openai
 from .utils import check_api_key
 
 class GPTEmbedder:
@@ -16,6 +15,7 @@ class GPTEmbedder:
     # replace newlines, which can negatively affect performance.
     texts = [ text.replace('\n', ' ') for text in texts ]
 
+    import openai
     result = openai.Embedding.create(
       input=texts,
       model=self.model,
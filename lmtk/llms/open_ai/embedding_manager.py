@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-import openai
 import numpy as np # openai already depends on this
 
 from .utils import check_api_key
@@ -23,6 +22,7 @@ class GPTEmbeddingManager:
     # replace newlines, which can negatively affect performance.
     texts = [ text.replace('\n', ' ') for text in texts ]
 
+    import openai
     result = openai.Embedding.create(
       input=texts,
       model=self.model,
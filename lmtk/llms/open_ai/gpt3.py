@@ -1,9 +1,12 @@
-import openai
 from ...errors import LmtkApiError
+from ...utils import Prefetch
+from .cache import CompletionCache
 from .utils import check_api_key, count_tokens, get_tokenizer
 
 class GPT3:
 
+  cache = None
+
   def __init__(self):
     check_api_key()
     get_tokenizer() # preload tokenizer
@@ -11,38 +14,77 @@ class GPT3:
   def count_tokens(self, text):
     return count_tokens(text)
 
+  @classmethod
+  def enable_cache(cls, folder_path):
+    cls.cache = CompletionCache(folder_path)
+
   def complete(self, *args, **kwargs):
+    if self.cache:
+      return self.complete_cached(*args, **kwargs)
+
     if kwargs.get('stream'):
       return self.get_response_async(*args, **kwargs)
     else:
       return self.get_response_sync(*args, **kwargs)
 
+  def complete_cached(self, *args, stream=False, **kwargs):
+    key = self.cache.key(*args, **kwargs)
+    text = self.cache.get(key)
+
+    if text is None and stream:
+      return self.stream_and_cache(key, *args, **kwargs)
+    elif text is None:
+      text = self.get_response_sync(*args, **kwargs)
+      self.cache.set(key, text)
+
+    return self.cache.replay(text) if stream else text
+
+  def stream_and_cache(self, key, *args, **kwargs):
+    parts = []
+    for data in self.get_response_async(*args, stream=True, **kwargs):
+      parts.append(data)
+      yield data
+    self.cache.set(key, ''.join(parts))
+
   def get_response_async(self, prompt, *args, rstrip_prompt_spaces=True, **kwargs):
-    new_prompt = prompt.rstrip(' ') if rstrip_prompt_spaces else prompt
+    import openai
+    new_prompt = self.strip_prompt(prompt, rstrip_prompt_spaces)
 
     try:
       response = self.get_response(new_prompt, *args, **kwargs)
-      for (i, data) in enumerate(response):
-        text = data.choices[0].text
-        if i == 0 and new_prompt is not prompt:
-          text = text.lstrip(' ')
-        yield text
+
+      # Reads events off the network while the caller renders
+      with Prefetch(response) as events:
+        for (i, data) in enumerate(events):
+          # OpenAIObject is a dict, and item access skips its __getattr__
+          text = data['choices'][0]['text']
+          yield self.strip_response(text, prompt, new_prompt) if i == 0 else text
     except openai.OpenAIError as error:
       raise LmtkApiError(error)
 
   def get_response_sync(self, prompt, *args, rstrip_prompt_spaces=True, **kwargs):
-    new_prompt = prompt.rstrip(' ') if rstrip_prompt_spaces else prompt
+    import openai
+    new_prompt = self.strip_prompt(prompt, rstrip_prompt_spaces)
 
     try:
       response = self.get_response(new_prompt, *args, **kwargs)
-      text =  response.choices[0].text
-      if new_prompt is not prompt:
-        text = text.lstrip(' ')
-      return text
+      return self.strip_response(response.choices[0].text, prompt, new_prompt)
     except openai.OpenAIError as error:
       raise LmtkApiError(error)
 
-  def get_response(self,
+  # Trailing spaces in a prompt hurt completions, so they're removed
+  # and the matching leading space is dropped from the response
+  def strip_prompt(self, prompt, rstrip_prompt_spaces=True):
+    return prompt.rstrip(' ') if rstrip_prompt_spaces else prompt
+
+  def strip_response(self, text, prompt, new_prompt):
+    return text.lstrip(' ') if new_prompt is not prompt else text
+
+  def get_response(self, *args, **kwargs):
+    import openai
+    return openai.Completion.create(**self.build_request(*args, **kwargs))
+
+  def build_request(self,
       prompt,
       max_length=1000,
       temperature=0.7,
@@ -56,7 +98,7 @@ class GPT3:
     for s in soft_stops:
       logit_bias[s] = -100
 
-    return openai.Completion.create(
+    return dict(
       engine=model,
       prompt=prompt,
       max_tokens=max_length,
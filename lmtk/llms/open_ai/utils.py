@@ -1,16 +1,38 @@
-import os, sys, tiktoken
+import os, sys, functools
+from collections import OrderedDict
 from ...utils import printer
 
+# openai and tiktoken are slow to import (tiktoken also
+# loads its vocab), so they are imported on first use to keep
+# startup fast
+
 def check_api_key():
   if not os.environ.get('OPENAI_API_KEY'):
     printer.print("[red]Please set the [blue]OPENAI_API_KEY[/blue] environment variable.[/red]\n\nIf you don't have one you can generate one here https://beta.openai.com/account/api-keys")
     sys.exit(1)
 
-tokenizer = None
-def get_tokenizer():
-  global tokenizer
-  tokenizer = tokenizer or tiktoken.get_encoding('gpt2')
-  return tokenizer
+# Loading an encoding parses the whole BPE vocab, so every
+# GPT3 instance shares a single (immutable) encoder
+@functools.lru_cache(maxsize=None)
+def get_tokenizer(name='gpt2'):
+  import tiktoken
+  return tiktoken.get_encoding(name)
+
+# SynthChat re-counts the same prompts and messages many times
+# while compressing a conversation. Counts are keyed on
+# (len, hash) so the cache doesn't hold on to every prompt.
+token_counts = OrderedDict()
+max_token_counts = 4096
 
 def count_tokens(text):
-  return len(get_tokenizer().encode(text))
+  key = (len(text), hash(text))
+  count = token_counts.get(key)
+  if count is not None:
+    token_counts.move_to_end(key)
+    return count
+
+  count = len(get_tokenizer().encode_ordinary(text))
+  token_counts[key] = count
+  if len(token_counts) > max_token_counts:
+    token_counts.popitem(last=False)
+  return count
@@ -1,4 +1,4 @@
-import sys, re
+import os, sys, re, time
 
 from .pretty import PrettyPrintREPL
 from .prompt import Prompt
@@ -12,6 +12,11 @@ from .commands import Commands
 
 class REPL:
 
+  render_interval = 0.033
+
+  # Only show the spinner if the first token is slower than this
+  first_run_loader_latency = 0.08
+
   def __init__(
       self,
       thread_name=None,
@@ -35,33 +40,36 @@ class REPL:
     self.mode = None
     self.first_run = True
 
+  # Loops rather than recursing so that running many commands
+  # in a row can't grow the stack
   def get_user_input(self):
-    default = ''
-    if len(self.auto_fills) > 0:
-      default = self.auto_fills.pop(0)
+    while True:
+      default = ''
+      if len(self.auto_fills) > 0:
+        default = self.auto_fills.pop(0)
 
-    try:
-      text = self.input(default=default)
-    except KeyboardInterrupt as error:
-      if len(self.prompt.text()) > 0:
-        return self.get_user_input()
-      else:
-        raise error
-
-    (action, new_text) = Commands.exec(
-      repl=self,
-      text=text,
-      print_text=lambda s: self.pretty.print(s)
-    )
+      try:
+        text = self.input(default=default)
+      except KeyboardInterrupt as error:
+        if len(self.prompt.text()) > 0:
+          continue
+        else:
+          raise error
+
+      (action, new_text) = Commands.exec(
+        repl=self,
+        text=text,
+        print_text=lambda s: self.pretty.print(s)
+      )
 
-    if action == 'prompt':
-      return self.get_user_input()
+      if action == 'prompt':
+        continue
 
-    if action == 'break':
-      return None
+      if action == 'break':
+        return None
 
-    if action == 'continue':
-      return new_text
+      if action == 'continue':
+        return new_text
 
   def run(self):
     if len(self.thread.get_messages()) == 0:
@@ -83,7 +91,7 @@ class REPL:
       except EOFError:
         self.pretty.leaving_thread()
         self.thread.save(stop=True)
-        sys.exit(0) # breaking might be better, but sys.exit is a lot faster
+        self.exit(0)
       except Exception as error:
         self.pretty.leaving_thread()
         printer.exception(error)
@@ -118,6 +126,13 @@ class REPL:
 
     self.first_run = False
 
+  # The thread is already saved (atomically) by this point, so skip
+  # interpreter teardown, which is slow with tiktoken and openai loaded
+  def exit(self, code=0):
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+
   def create_prompt(self):
     self.prompt = Prompt(self.config)
     self.prompt.bind_keys()
@@ -136,21 +151,40 @@ class REPL:
     self.mode = self.thread.load_mode()
     self.thread.save()
 
+  # The mode's generator runs on this thread so that its state
+  # is settled before any rollback. GPT3 prefetches the network
+  # stream underneath it.
   def ask(self, text):
-    delay = 0.25 if self.first_run else self.mode.loader_latency
+    delay = self.first_run_loader_latency if self.first_run else self.mode.loader_latency
     with Loader(show_timer=True, delay=delay):
       gen = iter(self.mode.ask(text))
       printer.warmup()
       response = peek(gen)[0]
 
-    answer = ''
+    parts = []
+    last_render = 0
+    is_stale = False
     with printer.live(transient=True) as screen:
       for data in response:
-        answer += data
-        display_text = self.pretty.partial_response(answer)
+        parts.append(data)
+
+        # Re-wrapping the whole answer on every token is quadratic,
+        # so cap the refresh rate unless a new line just started
+        now = time.monotonic()
+        if now - last_render < self.render_interval and '\n' not in data:
+          is_stale = True
+          continue
+        last_render = now
+        is_stale = False
+
+        display_text = self.pretty.partial_response(''.join(parts))
         screen.update(display_text)
 
-    return answer.strip()
+      # Show any tokens the throttle skipped
+      if is_stale:
+        screen.update(self.pretty.partial_response(''.join(parts)))
+
+    return ''.join(parts).strip()
 
   # When replaying the thread, it might have to load guesslang
   # and the UI will seem to be frozen. This avoids that. It
@@ -61,9 +61,10 @@ class PrettyPrintREPL:
     printer.print(f'[bold red]API Error:[/bold red] {message}\n\n  {repr(error)}\n')
 
   def replay_thread(self):
-    for i, msg in enumerate(self.repl.thread.get_messages()):
-      if msg.source == 'you':
-        self.your_banner(i + 1)
-      elif msg.source == 'them':
-        self.their_banner(i + 1, stats=msg.stats)
-      self.print(msg.text, newline=True)
+    with printer.buffer():
+      for i, msg in enumerate(self.repl.thread.get_messages()):
+        if msg.source == 'you':
+          self.your_banner(i + 1)
+        elif msg.source == 'them':
+          self.their_banner(i + 1, stats=msg.stats)
+        self.print(msg.text, newline=True)
@@ -1,9 +1,5 @@
-from prompt_toolkit import PromptSession
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.application.current import get_app
-from prompt_toolkit import filters as Filters
-
+# prompt_toolkit is a large import, so it's deferred until a
+# prompt is actually needed
 class Prompt:
 
   def __init__(self, config, erase_when_done=True, history_path=None):
@@ -15,6 +11,10 @@ class Prompt:
     self.start_session()
 
   def start_session(self):
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.key_binding import KeyBindings
+    from prompt_toolkit.history import FileHistory
+
     self.session = PromptSession(
       erase_when_done=self.erase_when_done,
       history=FileHistory(self.history_path),
@@ -22,6 +22,8 @@ class Prompt:
     self.kb = KeyBindings()
 
   def bind_keys(self):
+    is_not_searching = get_is_not_searching()
+
     @self.kb.add('tab', filter=is_not_searching)
     def _(event):
       prefix = event.current_buffer.document.leading_whitespace_in_current_line
@@ -49,6 +51,12 @@ class Prompt:
   def text(self):
     return self.session.layout.current_buffer.text
 
-@Filters.Condition
-def is_not_searching():
-  return not get_app().layout.is_searching
+def get_is_not_searching():
+  from prompt_toolkit.application.current import get_app
+  from prompt_toolkit import filters as Filters
+
+  @Filters.Condition
+  def is_not_searching():
+    return not get_app().layout.is_searching
+
+  return is_not_searching
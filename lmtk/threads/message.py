@@ -1,4 +1,4 @@
-import uuid
+import uuid, sys
 from datetime import datetime
 
 class Message:
@@ -7,7 +7,7 @@ class Message:
     self.id = str(uuid.uuid4())
     self.parent_id = parent_id
     # self.timestamp = datetime.now()
-    self.source = source
+    self.source = sys.intern(source) if source else source
     self.text = text
     self.stats = stats
 
@@ -24,7 +24,8 @@ class Message:
     self.id = data.get('id')
     self.parent_id = data.get('parent_id')
     # self.timestamp = data.get('timestamp')
-    self.source = data.get('source')
+    source = data.get('source')
+    self.source = sys.intern(source) if source else source
     self.text = data.get('text')
     self.stats = data.get('stats')
     return self
@@ -1,6 +1,7 @@
 import uuid, re, os, json
 from datetime import datetime
 from .message import Message
+from ..utils import write_file_atomic
 from ..modes import get_mode
 
 class Thread:
@@ -90,8 +91,7 @@ class Thread:
       self.seed = self.mode.get_seed()
 
     file_path = self.get_file_path()
-    with open(file_path, 'w') as thread_file:
-      json.dump(self.to_data(), thread_file, indent=2)
+    write_file_atomic(file_path, json.dumps(self.to_data(), indent=2))
 
     if stop:
       self.stop_mode()
@@ -1,9 +1,9 @@
 import os
-from prompt_toolkit import PromptSession
 from .misc import set_env
 
 def open_in_editor(prompt_session=None, extension='.txt', content=None):
   if not prompt_session:
+    from prompt_toolkit import PromptSession
     prompt_session = PromptSession(erase_when_done=True)
 
   with set_env('EDITOR', os.environ.get('EDITOR', 'vim')):
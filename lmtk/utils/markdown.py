@@ -115,20 +115,29 @@ class SmartMarkdown(Markdown):
     "document": DocumentElement,
   }
 
+  # Shared between renders since exporting clears the record buffer
+  record_console = None
+
+  @classmethod
+  def get_record_console(cls):
+    if not cls.record_console:
+      cls.record_console = Console(record=True)
+    return cls.record_console
+
   def to_text(self, styles=True):
-    console = Console(record=True)
+    console = self.get_record_console()
     with console.capture() as capture:
       console.print(self)
     return console.export_text(styles=styles)
 
   def to_html(self):
-    console = Console(record=True)
+    console = self.get_record_console()
     with console.capture() as capture:
       console.print(self)
     return console.export_html(inline_styles=True)
 
   def to_svg(self, title=''):
-    console = Console(record=True)
+    console = self.get_record_console()
     with console.capture() as capture:
       console.print(self)
     return console.export_svg(title=title)
@@ -1,4 +1,4 @@
-import os, re, pyperclip, html, sys, io, importlib
+import os, re, pyperclip, html, sys, io, importlib, uuid, queue, threading
 from itertools import chain
 from collections.abc import Iterable
 
@@ -6,6 +6,57 @@ def peek(gen):
   first = next(gen)
   return ( chain([ first ], gen), first )
 
+# Drains a generator on a background thread so that network
+# latency overlaps with whatever the consumer is doing. Errors
+# raised by the generator are re-raised in the consumer. The
+# generator must not touch state the consumer relies on, since
+# it runs ahead of it.
+class Prefetch:
+
+  done = object()
+
+  def __init__(self, gen):
+    self.gen = gen
+    self.queue = queue.SimpleQueue()
+    self.stopped = threading.Event()
+
+    self.thread = threading.Thread(target=self.produce, daemon=True)
+    self.thread.start()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *args):
+    self.close()
+
+  def __iter__(self):
+    while True:
+      item = self.get()
+      if item is self.done:
+        return
+      yield item
+
+  def close(self):
+    self.stopped.set()
+
+  def get(self):
+    (item, error) = self.queue.get()
+    if error:
+      raise error
+    return item
+
+  def produce(self):
+    try:
+      for item in self.gen:
+        if self.stopped.is_set():
+          getattr(self.gen, 'close', lambda: None)()
+          return
+        self.queue.put((item, None))
+    except BaseException as e:
+      self.queue.put((None, e))
+      return
+    self.queue.put((self.done, None))
+
 def make_iter(x):
   if isinstance(x, str) or not isinstance(x, Iterable):
     return iter([ x ])
@@ -24,6 +75,31 @@ def mkdirp(*args):
     os.makedirs(full_path)
   return full_path
 
+# Writes to a temp file in the same folder and renames it into
+# place, so a crash mid-write never leaves a truncated file. Symlinks
+# are resolved first so the link's target is what gets updated, and
+# the file keeps its existing mode (or the umask default if new).
+# `sync` also flushes the data to disk before the rename.
+def write_file_atomic(file_path, text, sync=False):
+  file_path = os.path.realpath(file_path)
+  folder_path, file_name = os.path.split(file_path)
+  temp_path = os.path.join(folder_path, f'.{file_name}.{uuid.uuid4().hex}.tmp')
+
+  # The kernel applies the umask to 0o666, like a normal open()
+  fd = os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+  try:
+    with os.fdopen(fd, 'w') as temp_file:
+      temp_file.write(text)
+      if sync:
+        temp_file.flush()
+        os.fsync(temp_file.fileno())
+    if os.path.exists(file_path):
+      os.chmod(temp_path, os.stat(file_path).st_mode & 0o777)
+    os.replace(temp_path, file_path)
+  except BaseException as e:
+    os.remove(temp_path)
+    raise e
+
 # Yeah, sorry not sorry. This is needed because of a
 # confluence of my 3 least favorite parts of Python:
 #   1. Shared mutable default parameters
@@ -41,6 +41,10 @@ class RichLive:
   def update(self, content):
     max_height = self.console.height - self.offset
 
+    # Each source line wraps to at least one screen line, so only
+    # the tail of the content can end up visible
+    content = '\n'.join(content.rsplit('\n', max_height)[-max_height:])
+
     # raw_text = Text.from_ansi(content, end='')
     raw_text = Text(content, end='')
     all_lines = raw_text.wrap(
@@ -133,6 +137,11 @@ class Printer:
 
     self.console.print(table)
 
+  # Holds console output until the block exits, then writes it
+  # to the terminal in one go
+  def buffer(self):
+    return self.console
+
   def live(self, transient=False, offset=0):
     return RichLive(console=self.console, transient=transient, offset=offset)
 